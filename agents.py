@@ -2,6 +2,8 @@
 
 import random
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Literal, Optional
 
 
@@ -147,7 +149,22 @@ def build_agent_prompt(
     Returns:
         System prompt string
     """
-    archetype = AGENT_ARCHETYPES[agent.style]
+    return build_agent_base_prompt(agent, patterns) + build_turn_instructions(turn_count)
+
+
+def build_agent_base_prompt(agent: Agent, patterns: list[str]) -> str:
+    """Build the part of the agent prompt that stays fixed for a whole call.
+
+    Kept separate from the turn instructions so it can be sent as a
+    cacheable system block.
+    """
+    return _render_agent_base_prompt(agent.name, agent.style, tuple(patterns))
+
+
+@lru_cache(maxsize=128)
+def _render_agent_base_prompt(name: str, style: str, patterns: tuple[str, ...]) -> str:
+    """Render the base agent prompt; cached since it only depends on its arguments."""
+    archetype = AGENT_ARCHETYPES[style]
 
     # Build patterns section
     if patterns:
@@ -162,27 +179,7 @@ YOUR LEARNINGS FROM PAST CALLS:
 This is your first shift. No prior experience yet - trust your instincts and learn as you go.
 """
 
-    # Turn-based instructions
-    turn_instructions = ""
-    if turn_count >= 8:
-        turn_instructions = """
-*** THIS IS TURN 8 - YOU MUST ACT NOW ***
-You MUST include [CLOSE: brief description] or [FLAG: brief reason] in this response.
-Example: "I'd love to work with you. [CLOSE: Luxury listing signed]"
-Example: "I can't proceed with this situation. [FLAG: No authority to sell]"
-The tag ENDS the call immediately. Do NOT continue talking after the tag.
-"""
-    elif turn_count >= 6:
-        turn_instructions = """
-*** URGENT: You've been on this call too long. Make a decision soon. ***
-Consider whether to [CLOSE: your pitch] or [FLAG: your concerns].
-"""
-    elif turn_count >= 4:
-        turn_instructions = """
-Note: This call is running long. Start thinking about whether to close or flag.
-"""
-
-    return f"""You are {agent.name}, a real estate agent taking calls from potential sellers.
+    return f"""You are {name}, a real estate agent taking calls from potential sellers.
 
 {archetype['style_description']}
 
@@ -330,7 +327,32 @@ MOTIVATION MATCHING:
 - HEAD clients: Want data, market analysis, specific strategy. Will ask about days on market, pricing methodology, marketing plan. Need logical justification but trust matters underneath.
 - HEART clients: Want to feel understood and respected. The property means something to them. Need connection before they can talk business.
 - HAND clients: Want efficiency and competence. "Just tell me you can handle this and let's move." Don't waste their time with discovery.
-{turn_instructions}
+"""
+
+
+def build_turn_instructions(turn_count: int) -> str:
+    """Build the close/flag timing instructions for the current turn."""
+    # Turn-based instructions
+    turn_instructions = ""
+    if turn_count >= 8:
+        turn_instructions = """
+*** THIS IS TURN 8 - YOU MUST ACT NOW ***
+You MUST include [CLOSE: brief description] or [FLAG: brief reason] in this response.
+Example: "I'd love to work with you. [CLOSE: Luxury listing signed]"
+Example: "I can't proceed with this situation. [FLAG: No authority to sell]"
+The tag ENDS the call immediately. Do NOT continue talking after the tag.
+"""
+    elif turn_count >= 6:
+        turn_instructions = """
+*** URGENT: You've been on this call too long. Make a decision soon. ***
+Consider whether to [CLOSE: your pitch] or [FLAG: your concerns].
+"""
+    elif turn_count >= 4:
+        turn_instructions = """
+Note: This call is running long. Start thinking about whether to close or flag.
+"""
+
+    return f"""{turn_instructions}
 Current turn: {turn_count}
 """
 
@@ -506,12 +528,13 @@ Based on this call, write ONE brief learning (under 15 words) that would help yo
 Respond with ONLY the learning, nothing else."""
 
 
-def get_archetype_info(style: str) -> dict:
-    """Get display information for an archetype."""
+@lru_cache(maxsize=128)
+def get_archetype_info(style: str) -> MappingProxyType:
+    """Get display information for an archetype (cached, read-only)."""
     archetype = AGENT_ARCHETYPES.get(style, {})
-    return {
+    return MappingProxyType({
         "style": style,
         "display_name": archetype.get("display_name", style.title()),
         "strength": archetype.get("strength", "Unknown"),
         "weakness": archetype.get("weakness", "Unknown")
-    }
+    })
@@ -4,36 +4,18 @@ import json
 import anthropic
 
 
-AGENT_CONFIDENCE_PROMPT = """Analyze this exchange between a real estate agent and a potential seller.
+TURN_ANALYSIS_PROMPT = """Analyze this exchange between a real estate agent and a potential seller.
 
 Last exchange:
 Agent: {agent_msg}
 Caller: {caller_msg}
 
-Based on this exchange, assess:
+First, from the agent's side, assess:
 1. Closing confidence (1-10): How confident is the agent that they can successfully close this deal?
 2. Customer motivation type (head/heart/hand percentages that sum to 100)
 3. Brief reasoning (one sentence)
 
-Respond in JSON format only:
-{{
-    "closing_confidence": <1-10>,
-    "motivation_guess": {{
-        "head": <0-100>,
-        "heart": <0-100>,
-        "hand": <0-100>
-    }},
-    "reasoning": "<one sentence>"
-}}"""
-
-
-SENTIMENT_PROMPT = """Analyze the seller's emotional state from this exchange.
-
-Last exchange:
-Agent: {agent_msg}
-Caller: {caller_msg}
-
-Rate the seller's current state (1-10 for each):
+Then rate the seller's current state (1-10 for each):
 - satisfaction: How happy are they with this interaction?
 - trust: How much do they trust the agent?
 - urgency: How urgently do they want to sell?
@@ -43,21 +25,93 @@ Rate the seller's current state (1-10 for each):
 
 Respond in JSON format only:
 {{
-    "satisfaction": <1-10>,
-    "trust": <1-10>,
-    "urgency": <1-10>,
-    "frustration": <1-10>,
-    "likelihood_to_convert": <1-10>,
-    "emotional_tone": "<one word>"
+    "confidence": {{
+        "closing_confidence": <1-10>,
+        "motivation_guess": {{
+            "head": <0-100>,
+            "heart": <0-100>,
+            "hand": <0-100>
+        }},
+        "reasoning": "<one sentence>"
+    }},
+    "sentiment": {{
+        "satisfaction": <1-10>,
+        "trust": <1-10>,
+        "urgency": <1-10>,
+        "frustration": <1-10>,
+        "likelihood_to_convert": <1-10>,
+        "emotional_tone": "<one word>"
+    }}
 }}"""
 
 
-async def get_agent_confidence(
-    client: anthropic.Anthropic,
+def _parse_json_reply(response) -> dict:
+    """Parse the JSON body of a model reply, tolerating a markdown code block."""
+    text = response.content[0].text.strip()
+
+    # Handle potential markdown code blocks
+    if text.startswith("```"):
+        text = text.split("```")[1]
+        if text.startswith("json"):
+            text = text[4:]
+
+    return json.loads(text)
+
+
+def _confidence_from(result: dict) -> dict:
+    """Fill in the expected confidence structure from a parsed reply."""
+    return {
+        "closing_confidence": result.get("closing_confidence", 5),
+        "fraud_likelihood": result.get("fraud_likelihood", 2),  # Keep for backward compat
+        "motivation_guess": result.get("motivation_guess", {
+            "head": 33,
+            "heart": 34,
+            "hand": 33
+        }),
+        "reasoning": result.get("reasoning", "Analyzing...")
+    }
+
+
+def _sentiment_from(result: dict) -> dict:
+    """Fill in the expected sentiment structure from a parsed reply."""
+    return {
+        "satisfaction": result.get("satisfaction", 5),
+        "trust": result.get("trust", 5),
+        "urgency": result.get("urgency", 5),
+        "frustration": result.get("frustration", 3),
+        "likelihood_to_convert": result.get("likelihood_to_convert", 5),
+        "emotional_tone": result.get("emotional_tone", "neutral")
+    }
+
+
+def _default_confidence() -> dict:
+    """Neutral confidence used when analysis fails."""
+    return {
+        "closing_confidence": 5,
+        "fraud_likelihood": 2,
+        "motivation_guess": {"head": 33, "heart": 34, "hand": 33},
+        "reasoning": "Analysis in progress..."
+    }
+
+
+def _default_sentiment() -> dict:
+    """Neutral sentiment used when analysis fails."""
+    return {
+        "satisfaction": 5,
+        "trust": 5,
+        "urgency": 5,
+        "frustration": 3,
+        "likelihood_to_convert": 5,
+        "emotional_tone": "neutral"
+    }
+
+
+async def get_turn_analysis(
+    client: anthropic.AsyncAnthropic,
     agent_msg: str,
     caller_msg: str
-) -> dict:
-    """Get agent's confidence assessment of the caller.
+) -> tuple[dict, dict]:
+    """Get the agent's confidence and the customer's sentiment in one call.
 
     Args:
         client: Anthropic client
@@ -65,134 +119,38 @@ async def get_agent_confidence(
         caller_msg: Caller's response
 
     Returns:
-        Dictionary with fraud_likelihood, motivation_guess, reasoning
+        Tuple of (confidence, sentiment) dictionaries
     """
-    prompt = AGENT_CONFIDENCE_PROMPT.format(
+    prompt = TURN_ANALYSIS_PROMPT.format(
         agent_msg=agent_msg,
         caller_msg=caller_msg
     )
 
     try:
-        response = client.messages.create(
+        response = await client.messages.create(
             model="claude-haiku-4-5-20251001",
-            max_tokens=150,
+            max_tokens=300,
             messages=[{"role": "user", "content": prompt}]
         )
 
-        text = response.content[0].text.strip()
-
-        # Parse JSON from response
-        # Handle potential markdown code blocks
-        if text.startswith("```"):
-            text = text.split("```")[1]
-            if text.startswith("json"):
-                text = text[4:]
-
-        result = json.loads(text)
-
-        # Ensure expected structure
-        return {
-            "closing_confidence": result.get("closing_confidence", 5),
-            "fraud_likelihood": result.get("fraud_likelihood", 2),  # Keep for backward compat
-            "motivation_guess": result.get("motivation_guess", {
-                "head": 33,
-                "heart": 34,
-                "hand": 33
-            }),
-            "reasoning": result.get("reasoning", "Analyzing...")
-        }
-
-    except (json.JSONDecodeError, KeyError, IndexError) as e:
-        print(f"Confidence parse error: {e}")
-        # Return neutral defaults on parse error
-        return {
-            "closing_confidence": 5,
-            "fraud_likelihood": 2,
-            "motivation_guess": {"head": 33, "heart": 34, "hand": 33},
-            "reasoning": "Analysis in progress..."
-        }
-    except Exception as e:
-        print(f"Confidence call error: {e}")
-        return {
-            "closing_confidence": 5,
-            "fraud_likelihood": 2,
-            "motivation_guess": {"head": 33, "heart": 34, "hand": 33},
-            "reasoning": "Analysis in progress..."
-        }
-
-
-async def get_customer_sentiment(
-    client: anthropic.Anthropic,
-    agent_msg: str,
-    caller_msg: str
-) -> dict:
-    """Get customer sentiment analysis.
-
-    Args:
-        client: Anthropic client
-        agent_msg: Agent's message
-        caller_msg: Caller's response
-
-    Returns:
-        Dictionary with sentiment metrics
-    """
-    prompt = SENTIMENT_PROMPT.format(
-        agent_msg=agent_msg,
-        caller_msg=caller_msg
-    )
+        result = _parse_json_reply(response)
 
-    try:
-        response = client.messages.create(
-            model="claude-haiku-4-5-20251001",
-            max_tokens=100,
-            messages=[{"role": "user", "content": prompt}]
+        return (
+            _confidence_from(result.get("confidence", {})),
+            _sentiment_from(result.get("sentiment", {}))
         )
 
-        text = response.content[0].text.strip()
-
-        # Handle potential markdown code blocks
-        if text.startswith("```"):
-            text = text.split("```")[1]
-            if text.startswith("json"):
-                text = text[4:]
-
-        result = json.loads(text)
-
-        # Ensure expected structure with defaults
-        return {
-            "satisfaction": result.get("satisfaction", 5),
-            "trust": result.get("trust", 5),
-            "urgency": result.get("urgency", 5),
-            "frustration": result.get("frustration", 3),
-            "likelihood_to_convert": result.get("likelihood_to_convert", 5),
-            "emotional_tone": result.get("emotional_tone", "neutral")
-        }
-
-    except (json.JSONDecodeError, KeyError, IndexError) as e:
-        print(f"Sentiment parse error: {e}")
+    except (json.JSONDecodeError, KeyError, IndexError, AttributeError) as e:
+        print(f"Turn analysis parse error: {e}")
         # Return neutral defaults on parse error
-        return {
-            "satisfaction": 5,
-            "trust": 5,
-            "urgency": 5,
-            "frustration": 3,
-            "likelihood_to_convert": 5,
-            "emotional_tone": "neutral"
-        }
+        return _default_confidence(), _default_sentiment()
     except Exception as e:
-        print(f"Sentiment call error: {e}")
-        return {
-            "satisfaction": 5,
-            "trust": 5,
-            "urgency": 5,
-            "frustration": 3,
-            "likelihood_to_convert": 5,
-            "emotional_tone": "neutral"
-        }
+        print(f"Turn analysis call error: {e}")
+        return _default_confidence(), _default_sentiment()
 
 
 async def generate_learning(
-    client: anthropic.Anthropic,
+    client: anthropic.AsyncAnthropic,
     learning_prompt: str
 ) -> str:
     """Generate post-call learning pattern.
@@ -205,7 +163,7 @@ async def generate_learning(
         Learning pattern string
     """
     try:
-        response = client.messages.create(
+        response = await client.messages.create(
             model="claude-haiku-4-5-20251001",
             max_tokens=50,
             messages=[{"role": "user", "content": learning_prompt}]
@@ -61,6 +61,20 @@ MIN_BOUNCE_TURN = 3  # Nobody bounces before turn 3 - give agent a chance
 HAND_EARLY_BOUNCE_TURN = 4  # HAND customers can bounce after turn 4 at lower threshold
 HAND_EARLY_BOUNCE_THRESHOLD = 6.0
 
+# Action tags: [CLOSE: pitch] and [FLAG: reason]
+CLOSE_TAG_RE = re.compile(r'\[CLOSE:\s*(.+?)\]', re.IGNORECASE | re.DOTALL)
+FLAG_TAG_RE = re.compile(r'\[FLAG:\s*(.+?)\]', re.IGNORECASE | re.DOTALL)
+ACTION_TAG_RE = re.compile(r'\[(?:CLOSE|FLAG):\s*(.+?)\]', re.IGNORECASE | re.DOTALL)
+
+# Phrases that count as the customer accepting a close, matched anywhere in the reply
+ACCEPT_PHRASES = (
+    "yes", "let's do", "i'm in", "let's work", "sounds good",
+    "i'll sign", "let's move forward", "i'm ready", "ready to",
+    "let's go", "deal", "you got it", "absolutely", "definitely",
+    "i accept", "count me in", "sign me up", "work together"
+)
+ACCEPT_RE = re.compile("|".join(map(re.escape, ACCEPT_PHRASES)))
+
 
 def check_close_attempt(text: str) -> tuple[bool, str]:
     """Check if agent attempted to close.
@@ -72,7 +86,7 @@ def check_close_attempt(text: str) -> tuple[bool, str]:
         Tuple of (attempted, pitch)
     """
     # Match [CLOSE: anything here]
-    match = re.search(r'\[CLOSE:\s*(.+?)\]', text, re.IGNORECASE | re.DOTALL)
+    match = CLOSE_TAG_RE.search(text)
     if match:
         pitch = match.group(1).strip()
         return True, pitch
@@ -89,7 +103,7 @@ def check_flag_attempt(text: str) -> tuple[bool, str]:
         Tuple of (flagged, reason)
     """
     # Match [FLAG: anything here]
-    match = re.search(r'\[FLAG:\s*(.+?)\]', text, re.IGNORECASE | re.DOTALL)
+    match = FLAG_TAG_RE.search(text)
     if match:
         reason = match.group(1).strip()
         return True, reason
@@ -105,9 +119,19 @@ def strip_action_tags(text: str) -> str:
     Returns:
         Clean text for display
     """
-    text = re.sub(r'\[CLOSE:\s*.+?\]', '', text, flags=re.IGNORECASE | re.DOTALL)
-    text = re.sub(r'\[FLAG:\s*.+?\]', '', text, flags=re.IGNORECASE | re.DOTALL)
-    return text.strip()
+    return ACTION_TAG_RE.sub('', text).strip()
+
+
+def check_close_accepted(text: str) -> bool:
+    """Check if customer accepted the agent's close.
+
+    Args:
+        text: Customer's response to the close
+
+    Returns:
+        True if the response contains an acceptance phrase
+    """
+    return ACCEPT_RE.search(text.lower()) is not None
 
 
 def assess_motivation_alignment(
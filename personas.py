@@ -2,10 +2,11 @@
 
 import random
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Customer:
     """Customer profile for a call."""
     name: str
@@ -26,21 +27,22 @@ class Customer:
         }
 
 
-# Name bank (diverse names)
-NAME_BANK = [
+# Name bank (diverse names) - exactly 64 so a 6-bit draw indexes it directly
+NAME_BANK = (
     "Alex", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Quinn", "Avery",
     "Skylar", "Dakota", "Reese", "Finley", "Rowan", "Sage", "Blair", "Drew",
     "Cameron", "Hayden", "Kendall", "Logan", "Parker", "Peyton", "Sydney", "Jamie",
     "Diana", "Marcus", "Elena", "David", "Priya", "James", "Sofia", "Michael",
     "Aisha", "Robert", "Chen", "Patricia", "Kenji", "Linda", "Fatima", "William",
     "Maria", "Thomas", "Yuki", "Jennifer", "Ahmed", "Lisa", "Omar", "Sarah",
-    "Raj", "Michelle", "Wei", "Karen", "Dmitri", "Emily", "Carlos", "Amanda"
-]
+    "Raj", "Michelle", "Wei", "Karen", "Dmitri", "Emily", "Carlos", "Amanda",
+    "Nadia", "Samuel", "Leila", "Mateo", "Grace", "Hiroshi", "Zara", "Andre"
+)
 
 # Call reasons by tier - legitimate sellers considering switching agents
 # Each opener should establish: greeting + what they're selling + why they're calling
 LEGIT_REASONS = {
-    "starter": [
+    "starter": (
         # Trust/Relationship concerns
         "Hi, I'm trying to sell my home - a three-bedroom in the Heights - and my current agent hasn't returned my calls in two weeks. Starting to wonder if they even care.",
         "Hi there. I have my first house on the market, been listed for three months with zero showings. Something's not working and I think I need a new agent.",
@@ -51,8 +53,8 @@ LEGIT_REASONS = {
         "Hi, I'm selling my first home and I just found out my listing photos are terrible compared to other houses. My agent said they're 'fine.' I don't think that's okay.",
         "Hi there. I have a house listed right now and every time I ask my agent for an update, I get vague answers. I just want honest communication.",
         "Hello, I'm selling my place and my agent has missed our last two scheduled calls. I need someone more reliable.",
-    ],
-    "luxury": [
+    ),
+    "luxury": (
         # Service/Expectations
         "Hi, I'm selling a home in the million-dollar range and my current agent is treating it like a starter house. I need someone who actually gets this market.",
         "Hello. I'm listing a luxury property and my current agent doesn't seem to have connections in this market. Honestly, it's frustrating.",
@@ -62,8 +64,8 @@ LEGIT_REASONS = {
         "Hello, I have a luxury home for sale and the luxury market moves differently. My current agent doesn't seem to understand that.",
         "Hi, I'm trying to sell a home around the million-dollar mark and I need an agent who knows how to attract serious buyers, not tourists who just want to see a nice house.",
         "Hi there. I'm selling a luxury property and my agent keeps suggesting open houses. That's not how you sell at this price point.",
-    ],
-    "estate": [
+    ),
+    "estate": (
         # Discretion/Privacy
         "Hello. I'm looking to sell a significant property - a family estate - and I need complete discretion on this sale. My current situation requires someone who understands privacy.",
         "Hi, I'm calling about selling an estate property that's been in my family for generations. I need someone who treats it with the respect it deserves.",
@@ -73,14 +75,14 @@ LEGIT_REASONS = {
         "Hello, I have an estate listing that's been on the market for a year with no movement. At this price point, I expected a different level of service.",
         "Hi, I'm selling a large estate property. I've been interviewing agents because the current approach just isn't working.",
         "Hello. I'm looking to sell a significant estate property. This needs to be handled correctly - one wrong move with a property like this and we'll have press coverage we don't want.",
-    ]
+    )
 }
 
 # Call reasons by tier - sketchy callers (something feels off)
 # Red flags are in behavior/urgency, NOT in representing someone else
 # The caller is ALWAYS the owner - they just act suspicious
 SKETCHY_REASONS = {
-    "starter": [
+    "starter": (
         # Urgency that doesn't add up
         "Hi, I need to sell my house fast - like, this week fast. Don't ask why, just tell me you can make it happen.",
         "Hey, I'm selling my house and my last agent was asking too many questions. I just need someone who can close deals quick.",
@@ -88,8 +90,8 @@ SKETCHY_REASONS = {
         # Evasive about basics
         "Hello, I own a house I need sold. I haven't been there in a while but that shouldn't matter. How fast can you list it?",
         "Hi, I'm selling my house but the tenants don't know yet. We'll deal with that later. What's your commission?",
-    ],
-    "luxury": [
+    ),
+    "luxury": (
         # Pressure and urgency
         "Hello, I need my luxury home sold before the end of the quarter. Don't ask about the timeline, just make it happen.",
         "Hi, I'm selling my high-end property. My previous agent backed out for some reason. I need someone who doesn't get cold feet.",
@@ -97,8 +99,8 @@ SKETCHY_REASONS = {
         # Dismissive of process
         "Hello, I own a luxury property and I need it sold fast. Skip the usual process - I just need results.",
         "Hi, I'm selling my home. It's worth over a million. We can sort out the paperwork after we have a buyer.",
-    ],
-    "estate": [
+    ),
+    "estate": (
         # Unusual circumstances
         "Hello. I own a significant estate property that needs to be sold quietly. No public listings, no open houses, no questions about why.",
         "Hi, I'm selling my estate and I need complete discretion. No one can know about this sale. Can you handle that?",
@@ -106,41 +108,68 @@ SKETCHY_REASONS = {
         # Pressure and intimidation
         "Hi there. I'm selling my estate property. I've worked with your competitor and they couldn't handle this. I hope you're more capable.",
         "Hello. I'm selling my estate - significant property, significant commission. I expect significant service without significant delays.",
-    ]
+    )
 }
 
+# Categorical orderings - integer ids index into these
+TIERS = ("starter", "luxury", "estate")
+MOTIVATIONS = ("head", "heart", "hand")
+TIER_IDS = {tier: i for i, tier in enumerate(TIERS)}
+MOTIVATION_IDS = {motivation: i for i, motivation in enumerate(MOTIVATIONS)}
+_NUM_TIERS = len(TIERS)
+_NUM_MOTIVATIONS = len(MOTIVATIONS)
+
+# Bound once so the generator skips the random.<attr> lookup on every draw
+_randrange = random.randrange
+_getrandbits = random.getrandbits
+
+# Call reasons indexed by [tier_id][is_sketchy] - one lookup, no branching
+CALL_REASONS = tuple(
+    (LEGIT_REASONS[tier], SKETCHY_REASONS[tier])
+    for tier in TIERS
+)
+
 # Patience levels by motivation
 PATIENCE_BY_MOTIVATION = {
     "head": 8,   # High patience - wants thorough info
     "heart": 5,  # Medium patience
     "hand": 3    # Low patience - wants speed
 }
+# Same values indexed by motivation id
+_PATIENCE_BY_MOTIVATION_ID = tuple(PATIENCE_BY_MOTIVATION[m] for m in MOTIVATIONS)
 
 
-def generate_customer(warmup_mode: bool = False) -> Customer:
-    """Generate a random customer profile.
-
-    Args:
-        warmup_mode: Currently unused, kept for API compatibility
-    """
-    name = random.choice(NAME_BANK)
-    tier = random.choice(["starter", "luxury", "estate"])
-    motivation = random.choice(["head", "heart", "hand"])
+def _draw_customer() -> tuple[Customer, int]:
+    """Draw a random customer profile along with its prompt template id."""
+    name = NAME_BANK[_getrandbits(6)]
+    tier_id = _randrange(_NUM_TIERS)
+    motivation_id = _randrange(_NUM_MOTIVATIONS)
 
     # Sketchy/fraud scenarios disabled for now - all customers are legitimate
     is_sketchy = False
-    call_reason = random.choice(LEGIT_REASONS[tier])
+    reasons = CALL_REASONS[tier_id][is_sketchy]
+    call_reason = reasons[_randrange(len(reasons))]
 
-    patience = PATIENCE_BY_MOTIVATION[motivation]
+    patience = _PATIENCE_BY_MOTIVATION_ID[motivation_id]
 
-    return Customer(
+    customer = Customer(
         name=name,
-        tier=tier,
-        motivation=motivation,
+        tier=TIERS[tier_id],
+        motivation=MOTIVATIONS[motivation_id],
         is_sketchy=is_sketchy,
         call_reason=call_reason,
         patience=patience
     )
+    return customer, _template_id(tier_id, motivation_id, is_sketchy)
+
+
+def generate_customer(warmup_mode: bool = False) -> Customer:
+    """Generate a random customer profile.
+
+    Args:
+        warmup_mode: Currently unused, kept for API compatibility
+    """
+    return _draw_customer()[0]
 
 
 SIMULATION_RULES = """
@@ -191,12 +220,38 @@ FRUSTRATION EXPRESSION - SHOW YOUR FEELINGS:
 
 def build_customer_prompt(customer: Customer) -> str:
     """Build the system prompt for a customer based on their profile."""
-    template_key = (customer.tier, customer.motivation, customer.is_sketchy)
-    base_prompt = CUSTOMER_PROMPTS[template_key].format(
-        name=customer.name,
-        call_reason=customer.call_reason
+    template_id = _template_id(
+        TIER_IDS[customer.tier],
+        MOTIVATION_IDS[customer.motivation],
+        customer.is_sketchy
     )
-    return base_prompt + SIMULATION_RULES
+    return _render_customer_prompt(template_id, customer.name, customer.call_reason)
+
+
+def generate_customer_with_prompt(warmup_mode: bool = False) -> tuple[Customer, str]:
+    """Generate a random customer profile together with its system prompt.
+
+    Args:
+        warmup_mode: Currently unused, kept for API compatibility
+
+    Returns:
+        Tuple of (customer, customer system prompt)
+    """
+    # Render straight from the drawn ids rather than mapping the strings back
+    customer, template_id = _draw_customer()
+    return customer, _render_customer_prompt(template_id, customer.name, customer.call_reason)
+
+
+def _template_id(tier_id: int, motivation_id: int, is_sketchy: bool) -> int:
+    """Flat index of a (tier, motivation, sketchy) template, 0-17."""
+    return tier_id * 6 + motivation_id * 2 + is_sketchy
+
+
+@lru_cache(maxsize=4096)
+def _render_customer_prompt(template_id: int, name: str, call_reason: str) -> str:
+    """Render a customer prompt. Every input comes from a small fixed pool."""
+    head, middle, tail = _PROMPT_PARTS[template_id]
+    return head + name + middle + call_reason + tail
 
 
 # 18 Customer prompt templates (3 tiers x 3 motivations x 2 sketchy states)
@@ -810,3 +865,27 @@ WHEN ASKED TO COMMIT:
 - If they ask questions: "This isn't going to work. I'll find someone else."
 """
 }
+
+
+def _split_template(template: str) -> tuple[str, str, str]:
+    """Split a template around its {name} and {call_reason} slots.
+
+    The simulation rules are folded into the tail so rendering is a
+    single concatenation with no format-string parsing.
+    """
+    head, _, rest = template.partition("{name}")
+    middle, _, tail = rest.partition("{call_reason}")
+    return head, middle, tail + SIMULATION_RULES
+
+
+def _build_prompt_parts() -> tuple[tuple[str, str, str], ...]:
+    parts = [None] * len(CUSTOMER_PROMPTS)
+    for (tier, motivation, is_sketchy), template in CUSTOMER_PROMPTS.items():
+        parts[_template_id(TIER_IDS[tier], MOTIVATION_IDS[motivation], is_sketchy)] = (
+            _split_template(template)
+        )
+    return tuple(parts)
+
+
+# Pre-split (head, middle, tail) of each template, indexed by _template_id
+_PROMPT_PARTS = _build_prompt_parts()
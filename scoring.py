@@ -1,10 +1,11 @@
 """Scoring system for Real Estate Agent Simulator."""
 
+from types import MappingProxyType
 from typing import Literal
 
 # Points matrix
 # Format: (tier, outcome) -> points
-POINTS_MATRIX = {
+POINTS_MATRIX = MappingProxyType({
     # Starter tier ($350K)
     ("starter", "conversion"): 1,
     ("starter", "missed_opp"): -1,
@@ -22,31 +23,35 @@ POINTS_MATRIX = {
     ("estate", "missed_opp"): -10,
     ("estate", "fraud_caught"): 10,
     ("estate", "fraud_missed"): -50,
-}
+})
 
 # Bonus for correct motivation guess
 MOTIVATION_BONUS = 2
 
+# Human-readable labels
+OUTCOME_DESCRIPTIONS = MappingProxyType({
+    "conversion": "Successfully signed the listing!",
+    "missed_opp": "Missed opportunity - client didn't sign",
+    "fraud_caught": "Sketchy situation correctly identified and avoided!",
+    "fraud_missed": "Signed a sketchy listing - bad outcome!",
+    "bounce": "Client left due to frustration"
+})
 
-def determine_outcome(
+TIER_DISPLAYS = MappingProxyType({
+    "starter": "Starter ($350K)",
+    "luxury": "Luxury ($1M)",
+    "estate": "Estate ($10M)"
+})
+
+
+def _resolve_outcome(
     close_attempted: bool,
     flag_used: bool,
     is_fraud: bool,
     converted: bool,
     customer_bounced: bool
-) -> Literal["conversion", "missed_opp", "fraud_caught", "fraud_missed", "bounce"]:
-    """Determine the outcome of a call.
-
-    Args:
-        close_attempted: Whether agent used [CLOSE: pitch]
-        flag_used: Whether agent used [FLAG: reason]
-        is_fraud: Whether customer was actually sketchy
-        converted: Whether customer would have converted (if close attempted on legit customer)
-        customer_bounced: Whether customer hung up due to frustration
-
-    Returns:
-        Outcome string for scoring
-    """
+) -> str:
+    """Outcome rules behind determine_outcome, evaluated once per flag combination."""
     # Customer bounced - they left before any resolution
     if customer_bounced:
         if is_fraud:
@@ -85,6 +90,38 @@ def determine_outcome(
         return "missed_opp"  # Lost a potential client
 
 
+# Every combination of the five outcome flags, indexed by their bit mask
+_OUTCOME_TABLE = tuple(
+    _resolve_outcome(*(bool(mask >> shift & 1) for shift in (4, 3, 2, 1, 0)))
+    for mask in range(32)
+)
+
+
+def determine_outcome(
+    close_attempted: bool,
+    flag_used: bool,
+    is_fraud: bool,
+    converted: bool,
+    customer_bounced: bool
+) -> Literal["conversion", "missed_opp", "fraud_caught", "fraud_missed"]:
+    """Determine the outcome of a call.
+
+    Args:
+        close_attempted: Whether agent used [CLOSE: pitch]
+        flag_used: Whether agent used [FLAG: reason]
+        is_fraud: Whether customer was actually sketchy
+        converted: Whether customer would have converted (if close attempted on legit customer)
+        customer_bounced: Whether customer hung up due to frustration
+
+    Returns:
+        Outcome string for scoring. Bounces resolve to missed_opp or
+        fraud_caught here, so scoring never sees a separate bounce outcome.
+    """
+    return _OUTCOME_TABLE[
+        close_attempted << 4 | flag_used << 3 | is_fraud << 2 | converted << 1 | customer_bounced
+    ]
+
+
 def calculate_score(
     tier: str,
     outcome: str,
@@ -100,33 +137,16 @@ def calculate_score(
     Returns:
         Total points for this call
     """
-    # Handle bounce outcome by mapping to appropriate base outcome
-    if outcome == "bounce":
-        outcome = "missed_opp"
-
     base_points = POINTS_MATRIX.get((tier, outcome), 0)
-    bonus = MOTIVATION_BONUS if motivation_correct else 0
 
-    return base_points + bonus
+    return base_points + MOTIVATION_BONUS * motivation_correct
 
 
 def get_outcome_description(outcome: str) -> str:
     """Get human-readable description of outcome."""
-    descriptions = {
-        "conversion": "Successfully signed the listing!",
-        "missed_opp": "Missed opportunity - client didn't sign",
-        "fraud_caught": "Sketchy situation correctly identified and avoided!",
-        "fraud_missed": "Signed a sketchy listing - bad outcome!",
-        "bounce": "Client left due to frustration"
-    }
-    return descriptions.get(outcome, "Unknown outcome")
+    return OUTCOME_DESCRIPTIONS.get(outcome, "Unknown outcome")
 
 
 def get_tier_display(tier: str) -> str:
     """Get display name for tier."""
-    displays = {
-        "starter": "Starter ($350K)",
-        "luxury": "Luxury ($1M)",
-        "estate": "Estate ($10M)"
-    }
-    return displays.get(tier, tier)
+    return TIER_DISPLAYS.get(tier, tier)
@@ -1,21 +1,25 @@
 """FastAPI server for Listing Closer Simulator."""
 
 import asyncio
+import itertools
 import os
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from dotenv import load_dotenv
 import anthropic
+import orjson
 
-from personas import Customer, generate_customer, build_customer_prompt
+from personas import Customer, generate_customer_with_prompt
 from agents import (
     Agent,
     generate_agent,
-    build_agent_prompt,
+    build_agent_base_prompt,
+    build_turn_instructions,
     get_post_call_learning_prompt,
     get_archetype_info
 )
@@ -24,6 +28,7 @@ from game import (
     check_close_attempt,
     check_flag_attempt,
     strip_action_tags,
+    check_close_accepted,
     assess_motivation_alignment,
     calculate_frustration_increase,
     check_customer_bounce,
@@ -37,19 +42,18 @@ from scoring import (
     get_tier_display
 )
 from storage import (
-    load_agent_state,
+    snapshot_agent_state,
     save_agent_state,
-    add_pattern,
-    update_agent_stats,
-    log_call,
+    record_call_result,
+    persist_call_results,
     load_call_history,
     get_leaderboard,
     get_overall_stats,
+    get_last_call_id,
     ensure_directories
 )
 from dashboard import (
-    get_agent_confidence,
-    get_customer_sentiment,
+    get_turn_analysis,
     generate_learning,
     get_dominant_motivation
 )
@@ -67,41 +71,114 @@ Path("images").mkdir(exist_ok=True)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 app.mount("/images", StaticFiles(directory="images"), name="images")
 
+# The page shell is small and fixed, so it is read once instead of per request
+INDEX_HTML = Path("static/index.html").read_bytes()
+# Avatars are large PNGs; they stay on disk behind FileResponse so browsers can revalidate
+AVATAR_FILES = frozenset(f"{style}.png" for style in ("closer", "detective", "empath", "robot", "gambler"))
+
 # Global state
 warmup_mode = False
-call_counter = 0
+call_ids = itertools.count(1)  # next() hands out call ids; reseeded at startup
+
+# Pause between speakers so calls are watchable; model calls overlap with it
+PACING_DELAY = float(os.getenv("PACING_DELAY", "1.0"))
+
+# One client for all websockets so every call reuses its keep-alive connection pool
+anthropic_client = anthropic.AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+
+# Finished calls waiting to be written; a single background task drains it
+call_writes: asyncio.Queue = asyncio.Queue()
+call_writer_task: Optional[asyncio.Task] = None
+
+
+def cached_block(text: str) -> dict:
+    """Wrap prompt text as a text block marked for Anthropic prompt caching."""
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
+
+async def send_event(websocket: WebSocket, event: dict):
+    """Send one event as a JSON text frame, encoded with orjson."""
+    await websocket.send_text(orjson.dumps(event).decode())
+
+
+async def send_events(websocket: WebSocket, *events: dict):
+    """Send events that happen together, as one batch frame when there are several."""
+    if len(events) == 1:
+        await send_event(websocket, events[0])
+    else:
+        await send_event(websocket, {"type": "batch", "events": list(events)})
+
+
+@app.on_event("startup")
+async def seed_call_counter():
+    """Continue call ids after the highest one already stored."""
+    global call_ids
+    call_ids = itertools.count(await asyncio.to_thread(get_last_call_id) + 1)
+
+
+async def call_writer():
+    """Write recorded calls to storage off the call's critical path.
+
+    Each save writes every call recorded since the last one, so calls that
+    finished while the previous write was running go out together. The
+    queue only signals that there is something to save.
+    """
+    while True:
+        batch = [await call_writes.get()]
+        while not call_writes.empty():
+            batch.append(call_writes.get_nowait())
+        try:
+            await asyncio.to_thread(persist_call_results)
+        except Exception as e:
+            print(f"ERROR saving calls {[c.get('call_id') for c in batch]}: {e}")
+        finally:
+            for _ in batch:
+                call_writes.task_done()
+
+
+@app.on_event("startup")
+async def start_call_writer():
+    """Start the background task that persists finished calls."""
+    global call_writer_task
+    call_writer_task = asyncio.create_task(call_writer())
+
+
+@app.on_event("shutdown")
+async def flush_call_writes():
+    """Let queued call writes finish before the process exits."""
+    await call_writes.join()
 
 
 @app.get("/")
 async def root():
-    return FileResponse("static/index.html")
+    return Response(INDEX_HTML, media_type="text/html")
 
 
 @app.get("/avatars/{filename}")
 async def get_avatar(filename: str):
     """Serve agent avatar images from root directory."""
-    filepath = Path(filename)
-    if filepath.suffix == ".png" and filepath.stem in ["closer", "detective", "empath", "robot", "gambler"]:
+    if filename in AVATAR_FILES:
         return FileResponse(filename)
-    return FileResponse("static/index.html")  # Fallback
+    return Response(INDEX_HTML, media_type="text/html")  # Fallback
 
 
+# Storage may hit JSONBin or disk, so these plain-def endpoints run in FastAPI's threadpool
 @app.get("/api/stats")
-async def get_stats():
+def get_stats():
     """Get overall statistics."""
     return get_overall_stats()
 
 
 @app.get("/api/leaderboard")
-async def get_agent_leaderboard():
+def get_agent_leaderboard():
     """Get agent archetype leaderboard."""
     return get_leaderboard()
 
 
 @app.get("/api/agent/{style}/stats")
-async def get_agent_stats(style: str):
+def get_agent_stats(style: str):
     """Get stats for a specific agent archetype."""
-    state = load_agent_state(style)
+    state = snapshot_agent_state(style)
     info = get_archetype_info(style)
     return {**state, **info}
 
@@ -123,46 +200,48 @@ async def get_warmup_status():
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
-    client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
 
     try:
         while True:
             data = await websocket.receive_json()
 
             if data.get("type") == "new_call":
-                await run_call(websocket, client)
+                await run_call(websocket, anthropic_client)
 
     except WebSocketDisconnect:
         print("Client disconnected")
 
 
-async def run_call(websocket: WebSocket, client: anthropic.Anthropic):
+async def run_call(websocket: WebSocket, client: anthropic.AsyncAnthropic):
     """Run a complete customer service call."""
-    global call_counter
-
-    call_counter += 1
-    call_id = call_counter
+    call_id = next(call_ids)
 
-    # Generate customer and agent
-    customer = generate_customer(warmup_mode)
+    # Generate customer (with their system prompt) and agent
+    customer, customer_prompt = generate_customer_with_prompt(warmup_mode)
     agent = generate_agent()
 
+    # Serialized once and shared by call_start, the call log and call_end
+    customer_dict = customer.to_dict()
+    agent_dict = agent.to_dict()
+    agent_info = dict(get_archetype_info(agent.style))
+
     # Load agent's learned patterns
-    agent_state = load_agent_state(agent.style)
+    agent_state = await asyncio.to_thread(snapshot_agent_state, agent.style)
     patterns = agent_state.get("patterns_noted", [])
 
+    # System prompts are fixed for the whole call, so cache their prefill
+    agent_system = [cached_block(build_agent_base_prompt(agent, patterns))]
+    customer_system = [cached_block(customer_prompt)]
+
     # Initialize call state
     state = CallState(customer=customer, agent=agent)
 
-    # Build prompts
-    customer_prompt = build_customer_prompt(customer)
-
     # Send call start info (includes customer preview for optional peek)
-    await websocket.send_json({
+    await send_event(websocket, {
         "type": "call_start",
         "call_id": call_id,
-        "agent": agent.to_dict(),
-        "agent_info": get_archetype_info(agent.style),
+        "agent": agent_dict,
+        "agent_info": agent_info,
         "customer_preview": {
             "name": customer.name,
             "tier": customer.tier,
@@ -187,8 +266,8 @@ async def run_call(websocket: WebSocket, client: anthropic.Anthropic):
     # Agent answers the phone with a scripted greeting (turn 0)
     greeting = f"Hi, thanks for calling! This is {agent.name} with Premiere Properties. How can I help you today?"
 
-    await websocket.send_json({"type": "typing", "speaker": "agent"})
-    await asyncio.sleep(1.0)
+    await send_event(websocket, {"type": "typing", "speaker": "agent"})
+    await asyncio.sleep(PACING_DELAY)
 
     state.transcript.append({
         "speaker": "agent",
@@ -196,7 +275,7 @@ async def run_call(websocket: WebSocket, client: anthropic.Anthropic):
         "turn": 0
     })
 
-    await websocket.send_json({
+    await send_event(websocket, {
         "type": "message",
         "speaker": "agent",
         "text": greeting,
@@ -204,9 +283,9 @@ async def run_call(websocket: WebSocket, client: anthropic.Anthropic):
     })
 
     # Customer states their reason
-    await asyncio.sleep(1.0)
-    await websocket.send_json({"type": "typing", "speaker": "customer"})
-    await asyncio.sleep(1.0)
+    await asyncio.sleep(PACING_DELAY)
+    await send_event(websocket, {"type": "typing", "speaker": "customer"})
+    await asyncio.sleep(PACING_DELAY)
 
     state.transcript.append({
         "speaker": "customer",
@@ -214,7 +293,7 @@ async def run_call(websocket: WebSocket, client: anthropic.Anthropic):
         "turn": 0
     })
 
-    await websocket.send_json({
+    await send_event(websocket, {
         "type": "message",
         "speaker": "customer",
         "text": customer.call_reason,
@@ -227,87 +306,151 @@ async def run_call(websocket: WebSocket, client: anthropic.Anthropic):
     customer_messages.append({"role": "user", "content": greeting})
     customer_messages.append({"role": "assistant", "content": customer.call_reason})
 
-    # Main conversation loop
-    while state.turn < MAX_TURNS:
-        state.turn += 1
-
-        # Build agent prompt with current turn
-        agent_prompt = build_agent_prompt(agent, patterns, state.turn)
-
-        # Agent's turn
-        await websocket.send_json({"type": "typing", "speaker": "agent"})
-        await asyncio.sleep(1.0)
-
-        # Agent always responds to the last customer message
+    def start_agent_turn(turn: int) -> asyncio.Task:
+        """Start the agent's model call for a turn; the agent always responds to the last customer message."""
+        # Agent prompt is the cached base plus this turn's instructions
+        agent_prompt = agent_system + [
+            {"type": "text", "text": build_turn_instructions(turn)}
+        ]
         user_content = customer_messages[-1]["content"]
-
-        agent_response = client.messages.create(
+        return asyncio.create_task(client.messages.create(
             model="claude-haiku-4-5-20251001",
             max_tokens=300,
             system=agent_prompt,
             messages=agent_messages + [{"role": "user", "content": user_content}]
-        )
+        ))
 
-        agent_text = agent_response.content[0].text
+    # Agent call started speculatively while the previous turn's dashboard analysis ran
+    next_agent_task = None
+    agent_task = customer_task = analysis_task = None
 
-        # Check for close or flag
-        close_attempted, close_pitch = check_close_attempt(agent_text)
-        flag_used, flag_reason = check_flag_attempt(agent_text)
+    # Main conversation loop
+    try:
+        while state.turn < MAX_TURNS:
+            state.turn += 1
 
-        if close_attempted:
-            state.close_attempted = True
-            state.close_pitch = close_pitch
+            # Agent's turn - the model call runs during the typing pause
+            agent_task = next_agent_task or start_agent_turn(state.turn)
+            next_agent_task = None
+            await send_event(websocket, {"type": "typing", "speaker": "agent"})
+            await asyncio.sleep(PACING_DELAY)
+            agent_response = await agent_task
 
-        if flag_used:
-            state.flag_used = True
-            state.flag_reason = flag_reason
+            agent_text = agent_response.content[0].text
 
-        # Clean text for display
-        display_text = strip_action_tags(agent_text)
+            # Check for close or flag
+            close_attempted, close_pitch = check_close_attempt(agent_text)
+            flag_used, flag_reason = check_flag_attempt(agent_text)
 
-        # Record in transcript
-        state.transcript.append({
-            "speaker": "agent",
-            "text": display_text,
-            "turn": state.turn
-        })
+            if close_attempted:
+                state.close_attempted = True
+                state.close_pitch = close_pitch
 
-        agent_messages.append({"role": "assistant", "content": agent_text})
+            if flag_used:
+                state.flag_used = True
+                state.flag_reason = flag_reason
 
-        # Send agent message
-        await websocket.send_json({
-            "type": "message",
-            "speaker": "agent",
-            "text": display_text,
-            "turn": state.turn
-        })
+            # Clean text for display
+            display_text = strip_action_tags(agent_text)
 
-        # If agent flagged, end call immediately (no customer response needed)
-        if flag_used:
-            await websocket.send_json({
-                "type": "message",
-                "speaker": "system",
-                "text": "[Call ended - Agent flagged for fraud]",
-                "turn": state.turn,
-                "is_end": True
+            # Record in transcript
+            state.transcript.append({
+                "speaker": "agent",
+                "text": display_text,
+                "turn": state.turn
             })
-            break
-
-        # If agent closed, let customer respond with YES or NO
-        if close_attempted:
-            # Get customer's final response to the close
-            await asyncio.sleep(1.0)
-            await websocket.send_json({"type": "typing", "speaker": "customer"})
-            await asyncio.sleep(1.0)
-
-            # Add instruction for customer to give final answer
-            close_instruction = "\n\n[The agent has asked for your business. You MUST respond with a clear YES or NO. This is your final answer.]"
-            customer_response = client.messages.create(
+
+            agent_messages.append({"role": "assistant", "content": agent_text})
+
+            # Agent message is sent together with any system message that ends the call
+            agent_event = {
+                "type": "message",
+                "speaker": "agent",
+                "text": display_text,
+                "turn": state.turn
+            }
+
+            # If agent flagged, end call immediately (no customer response needed)
+            if flag_used:
+                await send_events(websocket, agent_event, {
+                    "type": "message",
+                    "speaker": "system",
+                    "text": "[Call ended - Agent flagged for fraud]",
+                    "turn": state.turn,
+                    "is_end": True
+                })
+                break
+
+            # Turn 8 is the last agent turn - force close if they didn't act
+            if not close_attempted and state.turn >= 8:
+                # Agent didn't close/flag despite instructions - force a close
+                state.close_attempted = True
+                state.close_pitch = "(Agent failed to make explicit close - forced close)"
+                await send_events(websocket, agent_event, {
+                    "type": "message",
+                    "speaker": "system",
+                    "text": "[Call ended - Turn limit reached without close]",
+                    "turn": state.turn,
+                    "is_end": True
+                })
+                break
+
+            await send_event(websocket, agent_event)
+
+            # If agent closed, let customer respond with YES or NO
+            if close_attempted:
+                # Get customer's final response to the close, instructed to give a final answer
+                close_instruction = "\n\n[The agent has asked for your business. You MUST respond with a clear YES or NO. This is your final answer.]"
+                customer_task = asyncio.create_task(client.messages.create(
+                    model="claude-haiku-4-5-20251001",
+                    max_tokens=150,
+                    system=customer_system + [{"type": "text", "text": close_instruction}],
+                    messages=customer_messages + [{"role": "user", "content": agent_text}]
+                ))
+                await asyncio.sleep(PACING_DELAY)
+                await send_event(websocket, {"type": "typing", "speaker": "customer"})
+                await asyncio.sleep(PACING_DELAY)
+                customer_response = await customer_task
+
+                customer_text = customer_response.content[0].text
+
+                # Record in transcript
+                state.transcript.append({
+                    "speaker": "customer",
+                    "text": customer_text,
+                    "turn": state.turn
+                })
+
+                # Check if customer said yes (converted)
+                if check_close_accepted(customer_text):
+                    state.converted_on_close = True
+
+                # Send customer's final response with the call-ending message
+                await send_events(websocket, {
+                    "type": "message",
+                    "speaker": "customer",
+                    "text": customer_text,
+                    "turn": state.turn
+                }, {
+                    "type": "message",
+                    "speaker": "system",
+                    "text": "[Call ended - Agent closed]",
+                    "turn": state.turn,
+                    "is_end": True
+                })
+                break
+
+            # Customer's turn - the model call runs during the pause and typing
+            customer_task = asyncio.create_task(client.messages.create(
                 model="claude-haiku-4-5-20251001",
-                max_tokens=150,
-                system=customer_prompt + close_instruction,
+                max_tokens=200,
+                system=customer_system,
                 messages=customer_messages + [{"role": "user", "content": agent_text}]
-            )
+            ))
+            await asyncio.sleep(PACING_DELAY)
+            await send_event(websocket, {"type": "typing", "speaker": "customer"})
+            await asyncio.sleep(PACING_DELAY)
+            customer_response = await customer_task
 
             customer_text = customer_response.content[0].text
 
@@ -318,144 +461,86 @@ async def run_call(websocket: WebSocket, client: anthropic.Anthropic):
                 "turn": state.turn
             })
 
-            # Send customer's final response
-            await websocket.send_json({
+            customer_messages.append({"role": "assistant", "content": customer_text})
+            agent_messages.append({"role": "user", "content": customer_text})
+
+            # Dashboard analysis (confidence + sentiment) in a single model call. The next
+            # agent turn only needs the customer's reply, so start it alongside and
+            # cancel it if the analysis ends the call
+            analysis_task = asyncio.create_task(get_turn_analysis(client, display_text, customer_text))
+            if state.turn < MAX_TURNS:
+                next_agent_task = start_agent_turn(state.turn + 1)
+
+            # Send customer message
+            await send_event(websocket, {
                 "type": "message",
                 "speaker": "customer",
                 "text": customer_text,
                 "turn": state.turn
             })
 
-            # Check if customer said yes (converted)
-            customer_lower = customer_text.lower()
-            yes_phrases = [
-                "yes", "let's do", "i'm in", "let's work", "sounds good",
-                "i'll sign", "let's move forward", "i'm ready", "ready to",
-                "let's go", "deal", "you got it", "absolutely", "definitely",
-                "i accept", "count me in", "sign me up", "work together"
-            ]
-            if any(phrase in customer_lower for phrase in yes_phrases):
-                state.converted_on_close = True
-
-            await websocket.send_json({
-                "type": "message",
-                "speaker": "system",
-                "text": "[Call ended - Agent closed]",
-                "turn": state.turn,
-                "is_end": True
-            })
-            break
-
-        # Turn 8 is the last agent turn - force close if they didn't act
-        if state.turn >= 8:
-            # Agent didn't close/flag despite instructions - force a close
-            state.close_attempted = True
-            state.close_pitch = "(Agent failed to make explicit close - forced close)"
-            await websocket.send_json({
-                "type": "message",
-                "speaker": "system",
-                "text": "[Call ended - Turn limit reached without close]",
-                "turn": state.turn,
-                "is_end": True
-            })
-            break
-
-        # Customer's turn
-        await asyncio.sleep(1.0)
-        await websocket.send_json({"type": "typing", "speaker": "customer"})
-        await asyncio.sleep(1.0)
-
-        customer_response = client.messages.create(
-            model="claude-haiku-4-5-20251001",
-            max_tokens=200,
-            system=customer_prompt,
-            messages=customer_messages + [{"role": "user", "content": agent_text}]
-        )
-
-        customer_text = customer_response.content[0].text
-
-        # Record in transcript
-        state.transcript.append({
-            "speaker": "customer",
-            "text": customer_text,
-            "turn": state.turn
-        })
-
-        customer_messages.append({"role": "assistant", "content": customer_text})
-        agent_messages.append({"role": "user", "content": customer_text})
-
-        # Send customer message
-        await websocket.send_json({
-            "type": "message",
-            "speaker": "customer",
-            "text": customer_text,
-            "turn": state.turn
-        })
-
-        # Run dashboard analysis in parallel
-        confidence_task = asyncio.create_task(
-            get_agent_confidence(client, display_text, customer_text)
-        )
-        sentiment_task = asyncio.create_task(
-            get_customer_sentiment(client, display_text, customer_text)
-        )
-
-        confidence = await confidence_task
-        sentiment = await sentiment_task
+            confidence, sentiment = await analysis_task
 
-        # Update state sentiment
-        state.sentiment = sentiment
+            # Update state sentiment
+            state.sentiment = sentiment
 
-        # Calculate and update frustration
-        alignment = assess_motivation_alignment(agent_text, customer.motivation)
-        frustration_increase = calculate_frustration_increase(
-            agent_text, customer.motivation, alignment
-        )
-        state.frustration = min(state.frustration + frustration_increase, 10.0)
-
-        # Send dashboard update
-        await websocket.send_json({
-            "type": "dashboard_update",
-            "turn": state.turn,
-            "confidence": confidence,
-            "sentiment": sentiment,
-            "frustration": state.frustration,
-            "alignment": alignment
-        })
-
-        # Check for customer bounce
-        if check_customer_bounce(state):
-            state.customer_bounced = True
-
-            # Send bounce message
-            bounce_msg = get_bounce_message(customer.motivation)
-            state.transcript.append({
-                "speaker": "customer",
-                "text": bounce_msg,
-                "turn": state.turn
-            })
-
-            await websocket.send_json({
-                "type": "message",
-                "speaker": "customer",
-                "text": bounce_msg,
-                "turn": state.turn,
-                "is_bounce": True
-            })
+            # Calculate and update frustration
+            alignment = assess_motivation_alignment(agent_text, customer.motivation)
+            frustration_increase = calculate_frustration_increase(
+                agent_text, customer.motivation, alignment
+            )
+            state.frustration = min(state.frustration + frustration_increase, 10.0)
 
-            # Send call-ending system message
-            await websocket.send_json({
-                "type": "message",
-                "speaker": "system",
-                "text": "[Call ended - Customer hung up]",
+            dashboard_event = {
+                "type": "dashboard_update",
                 "turn": state.turn,
-                "is_end": True
-            })
-            break
+                "confidence": confidence,
+                "sentiment": sentiment,
+                "frustration": state.frustration,
+                "alignment": alignment
+            }
+
+            # Check for customer bounce
+            if check_customer_bounce(state):
+                state.customer_bounced = True
+
+                bounce_msg = get_bounce_message(customer.motivation)
+                state.transcript.append({
+                    "speaker": "customer",
+                    "text": bounce_msg,
+                    "turn": state.turn
+                })
+
+                # Send dashboard update, bounce message and call-ending system message together
+                await send_events(websocket, dashboard_event, {
+                    "type": "message",
+                    "speaker": "customer",
+                    "text": bounce_msg,
+                    "turn": state.turn,
+                    "is_bounce": True
+                }, {
+                    "type": "message",
+                    "speaker": "system",
+                    "text": "[Call ended - Customer hung up]",
+                    "turn": state.turn,
+                    "is_end": True
+                })
+                break
+
+            # Send dashboard update
+            await send_event(websocket, dashboard_event)
+    finally:
+        # Leaving early (a disconnect, an error, a bounce) must not leave model calls
+        # running; gathering also retrieves any exception they ended with
+        tasks = [t for t in (agent_task, customer_task, analysis_task, next_agent_task) if t]
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     # If we hit max turns without a close/flag/bounce, send timeout message
     if state.turn >= MAX_TURNS and not state.close_attempted and not state.flag_used and not state.customer_bounced:
-        await websocket.send_json({
+        await send_event(websocket, {
             "type": "message",
             "speaker": "system",
             "text": "[Call ended - Maximum turns reached]",
@@ -499,10 +584,6 @@ async def run_call(websocket: WebSocket, client: anthropic.Anthropic):
         )
         new_pattern = await generate_learning(client, learning_prompt)
 
-        # Save pattern to agent state
-        add_pattern(agent.style, new_pattern)
-
-        # Update agent stats
         call_summary = {
             "call_id": call_id,
             "customer_tier": customer.tier,
@@ -512,14 +593,13 @@ async def run_call(websocket: WebSocket, client: anthropic.Anthropic):
             "points": points,
             "turns": state.turn
         }
-        update_agent_stats(agent.style, outcome, points, call_summary)
 
-        # Log full call
+        # Full call log
         call_record = {
             "call_id": str(call_id),
             "timestamp": datetime.now().isoformat(),
-            "customer": customer.to_dict(),
-            "agent": agent.to_dict(),
+            "customer": customer_dict,
+            "agent": agent_dict,
             "turns_used": state.turn,
             "close_attempted": state.close_attempted,
             "close_pitch": state.close_pitch,
@@ -536,7 +616,14 @@ async def run_call(websocket: WebSocket, client: anthropic.Anthropic):
             "final_frustration": state.frustration,
             "transcript": state.transcript
         }
-        log_call(call_record)
+
+        # Fold pattern, agent stats and call log into memory now; the writes to
+        # JSONBin and disk are queued so call_end doesn't wait on them
+        await asyncio.to_thread(
+            record_call_result,
+            agent.style, new_pattern, outcome, points, call_summary, call_record
+        )
+        call_writes.put_nowait(call_record)
 
     except Exception as e:
         print(f"ERROR in post-call processing: {e}")
@@ -549,17 +636,19 @@ async def run_call(websocket: WebSocket, client: anthropic.Anthropic):
         motivation_correct = False
         new_pattern = "(Error generating learning)"
 
+    overall_stats = await asyncio.to_thread(get_overall_stats)
+
     # Send call end summary (always send, even if there was an error above)
-    await websocket.send_json({
+    await send_event(websocket, {
         "type": "call_end",
         "call_id": call_id,
         "outcome": outcome,
         "outcome_description": get_outcome_description(outcome),
         "points": points,
-        "customer": customer.to_dict(),
+        "customer": customer_dict,
         "customer_tier_display": get_tier_display(customer.tier),
-        "agent": agent.to_dict(),
-        "agent_info": get_archetype_info(agent.style),
+        "agent": agent_dict,
+        "agent_info": agent_info,
         "close_attempted": state.close_attempted,
         "close_pitch": state.close_pitch,
         "flag_used": state.flag_used,
@@ -571,7 +660,7 @@ async def run_call(websocket: WebSocket, client: anthropic.Anthropic):
         "new_pattern": new_pattern,
         "turns_used": state.turn,
         "final_sentiment": state.sentiment,
-        "overall_stats": get_overall_stats(),
+        "overall_stats": overall_stats,
         "transcript": state.transcript
     })
 
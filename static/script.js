@@ -116,6 +116,9 @@ function handleMessage(data) {
             console.log('Call end received:', data);
             handleCallEnd(data);
             break;
+        case 'batch':
+            data.events.forEach(handleMessage);
+            break;
         default:
             console.log('Unknown message type:', data.type);
     }
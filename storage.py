@@ -4,13 +4,15 @@ Uses JSONBin.io for cloud persistence (free tier).
 Falls back to local files if JSONBin is not configured.
 """
 
-import json
+import copy
 import os
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 import httpx
+import orjson
 
 
 # JSONBin.io configuration
@@ -22,16 +24,41 @@ JSONBIN_BASE_URL = "https://api.jsonbin.io/v3/b"
 # Local paths (fallback)
 RESULTS_DIR = Path("results")
 AGENT_STATES_DIR = RESULTS_DIR / "agent_states"
-CALL_LOGS_FILE = RESULTS_DIR / "call_logs.json"
+CALL_LOGS_FILE = RESULTS_DIR / "call_logs.jsonl"  # One JSON record per line, append-only
+LEGACY_CALL_LOGS_FILE = RESULTS_DIR / "call_logs.json"  # Older single-array format, read only
+
+# Outcomes counted as a missed opportunity (bounce is an older outcome name)
+_MISSED_OUTCOMES = frozenset({"missed_opp", "bounce"})
 
 # In-memory cache for the session
 _call_history_cache: list = []
 _agent_states_cache: dict = {}
+_overall_totals: dict = {"calls": 0, "points": 0, "outcomes": {}}  # Running totals over the history
+_dirty_styles: set = set()  # Styles changed since their local state file was written
+
+# Set once the first load has filled the cache, so an empty store isn't fetched
+# again on every access. Left unset when JSONBin errors, so the next access retries
+_call_history_loaded = False
+_agent_states_loaded = False
+
+# How many history entries are already in the local call log; later ones still need writing
+_call_log_written = 0
+
+# Serializes writers; the server calls storage from worker threads
+_write_lock = threading.Lock()
+# Held across snapshot and write, so saves land in the order their snapshots were taken
+_persist_lock = threading.Lock()
+_stats_lock = threading.Lock()
+# Guards the first load of each cache, so nobody sees it empty while it is being fetched
+_load_lock = threading.Lock()
 
 
-def _jsonbin_enabled() -> bool:
-    """Check if JSONBin is configured."""
-    return bool(JSONBIN_API_KEY and JSONBIN_CALLS_BIN_ID and JSONBIN_AGENTS_BIN_ID)
+# Configuration is read once at import, so these are fixed for the process
+_JSONBIN_ENABLED = bool(JSONBIN_API_KEY and JSONBIN_CALLS_BIN_ID and JSONBIN_AGENTS_BIN_ID)
+_JSONBIN_HEADERS = {
+    "Content-Type": "application/json",
+    "X-Master-Key": JSONBIN_API_KEY
+}
 
 
 def _log_jsonbin_config():
@@ -42,7 +69,7 @@ def _log_jsonbin_config():
     print(f"  JSONBIN_API_KEY: {'SET' if JSONBIN_API_KEY else 'NOT SET'}")
     print(f"  JSONBIN_CALLS_BIN_ID: {JSONBIN_CALLS_BIN_ID if JSONBIN_CALLS_BIN_ID else 'NOT SET'}")
     print(f"  JSONBIN_AGENTS_BIN_ID: {JSONBIN_AGENTS_BIN_ID if JSONBIN_AGENTS_BIN_ID else 'NOT SET'}")
-    print(f"  JSONBin enabled: {_jsonbin_enabled()}")
+    print(f"  JSONBin enabled: {_JSONBIN_ENABLED}")
     print("=" * 60 + "\n")
 
 
@@ -50,12 +77,8 @@ def _log_jsonbin_config():
 _log_jsonbin_config()
 
 
-def _jsonbin_headers() -> dict:
-    """Get headers for JSONBin API calls."""
-    return {
-        "Content-Type": "application/json",
-        "X-Master-Key": JSONBIN_API_KEY
-    }
+# One pooled client so JSONBin requests reuse a kept-alive TLS connection
+_http_client = httpx.Client(timeout=10.0)
 
 
 def _load_from_jsonbin(bin_id: str) -> Optional[dict]:
@@ -66,13 +89,12 @@ def _load_from_jsonbin(bin_id: str) -> Optional[dict]:
     try:
         url = f"{JSONBIN_BASE_URL}/{bin_id}/latest"
         print(f"JSONBin loading from bin {bin_id}...")
-        response = httpx.get(
+        response = _http_client.get(
             url,
-            headers=_jsonbin_headers(),
-            timeout=10.0
+            headers=_JSONBIN_HEADERS
         )
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"JSONBin load SUCCESS from bin {bin_id}")
             return data.get("record", {})
         else:
@@ -90,11 +112,10 @@ def _save_to_jsonbin(bin_id: str, data: dict) -> bool:
     try:
         url = f"{JSONBIN_BASE_URL}/{bin_id}"
         print(f"JSONBin saving to bin {bin_id}...")
-        response = httpx.put(
+        response = _http_client.put(
             url,
-            headers=_jsonbin_headers(),
-            json=data,
-            timeout=10.0
+            headers=_JSONBIN_HEADERS,
+            content=orjson.dumps(data)
         )
         if response.status_code == 200:
             print(f"JSONBin save SUCCESS to bin {bin_id}")
@@ -128,48 +149,99 @@ def get_default_agent_state(style: str) -> dict:
     }
 
 
-def _load_all_agent_states() -> dict:
-    """Load all agent states from JSONBin or cache."""
-    global _agent_states_cache
-
-    # Return cache if populated
-    if _agent_states_cache:
-        return _agent_states_cache
+def _read_agent_states() -> tuple[dict, bool]:
+    """Read all agent states from JSONBin, falling back to local files.
 
+    Returns the states and whether the read is final; it isn't when
+    JSONBin errored, so a later access tries again.
+    """
     # Try JSONBin first
-    if _jsonbin_enabled():
+    fetched = True
+    if _JSONBIN_ENABLED:
         data = _load_from_jsonbin(JSONBIN_AGENTS_BIN_ID)
         if data:
-            _agent_states_cache = data
-            return _agent_states_cache
+            return data, True
+        fetched = data is not None
 
     # Fall back to local files
+    states = {}
     ensure_directories()
     for style_file in AGENT_STATES_DIR.glob("*.json"):
         try:
-            with open(style_file) as f:
-                state = json.load(f)
-                _agent_states_cache[state["style"]] = state
-        except (json.JSONDecodeError, KeyError):
+            with open(style_file, "rb") as f:
+                state = orjson.loads(f.read())
+                states[state["style"]] = state
+        except (orjson.JSONDecodeError, KeyError):
             continue
 
+    return states, fetched
+
+
+def _load_all_agent_states() -> dict:
+    """Load all agent states from JSONBin or cache."""
+    global _agent_states_cache, _agent_states_loaded
+
+    # Return cache if populated or already loaded
+    if _agent_states_cache or _agent_states_loaded:
+        return _agent_states_cache
+
+    # One thread does the first load; concurrent callers wait and then use its result
+    with _load_lock:
+        if not (_agent_states_cache or _agent_states_loaded):
+            states, final = _read_agent_states()
+            _agent_states_cache = states
+            _agent_states_loaded = final
+
     return _agent_states_cache
 
 
-def _save_all_agent_states():
-    """Save all agent states to JSONBin and local files."""
-    global _agent_states_cache
+def _write_atomic(path: Path, data: bytes):
+    """Replace a file's contents so readers see either the old or the new file, never a partial one."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        # Data must be on disk before the rename, or a crash can leave an empty file
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
 
-    # Save to JSONBin
-    if _jsonbin_enabled():
-        _save_to_jsonbin(JSONBIN_AGENTS_BIN_ID, _agent_states_cache)
 
-    # Also save locally
-    ensure_directories()
-    for style, state in _agent_states_cache.items():
-        state_file = AGENT_STATES_DIR / f"{style}.json"
-        with open(state_file, "w") as f:
-            json.dump(state, f, indent=2)
+def _write_agent_states(states: dict, styles: set):
+    """Write agent states to JSONBin, and the given styles to local files."""
+    # Save to JSONBin (the bin is replaced whole, so it gets every style)
+    if _JSONBIN_ENABLED:
+        _save_to_jsonbin(JSONBIN_AGENTS_BIN_ID, states)
+
+    # Also save locally, only the files that changed
+    try:
+        ensure_directories()
+        for style in styles:
+            _write_atomic(AGENT_STATES_DIR / f"{style}.json", orjson.dumps(states[style]))
+    except Exception:
+        # Mark them dirty again so the next save retries these files
+        with _write_lock:
+            _dirty_styles.update(styles)
+        raise
+
+
+def _take_dirty_styles() -> set:
+    """Return the styles changed since the last write and reset the set."""
+    styles = set(_dirty_styles)
+    _dirty_styles.clear()
+    return styles
+
+
+def _snapshot_agent_states() -> tuple[dict, set]:
+    """Copy the agent states and take the dirty styles. Call with _write_lock held."""
+    return copy.deepcopy(_agent_states_cache), _take_dirty_styles()
+
+
+def _save_all_agent_states():
+    """Save all agent states to JSONBin and changed ones to local files."""
+    with _persist_lock:
+        with _write_lock:
+            states, styles = _snapshot_agent_states()
+        _write_agent_states(states, styles)
 
 
 def load_agent_state(style: str) -> dict:
@@ -178,37 +250,36 @@ def load_agent_state(style: str) -> dict:
     return all_states.get(style, get_default_agent_state(style))
 
 
+def snapshot_agent_state(style: str) -> dict:
+    """Copy an agent's state under the lock, for readers outside the event loop."""
+    # Writers update the cached state in place from other threads
+    _load_all_agent_states()
+    with _write_lock:
+        return copy.deepcopy(load_agent_state(style))
+
+
 def save_agent_state(style: str, state: dict):
     """Save agent state for a specific archetype."""
-    global _agent_states_cache
-    _agent_states_cache[style] = state
+    # Load first, so the stored states don't later replace this one
+    _load_all_agent_states()
+    with _write_lock:
+        _agent_states_cache[style] = state
+        _dirty_styles.add(style)
     _save_all_agent_states()
 
 
-def add_pattern(style: str, pattern: str, max_patterns: int = 10):
-    """Add a learned pattern to an agent's state."""
-    state = load_agent_state(style)
-
+def _apply_pattern(state: dict, pattern: str, max_patterns: int = 10):
+    """Add a learned pattern to an agent state in memory."""
     # Avoid duplicates
     if pattern not in state["patterns_noted"]:
         state["patterns_noted"].append(pattern)
 
-        # Keep only most recent patterns
-        if len(state["patterns_noted"]) > max_patterns:
-            state["patterns_noted"] = state["patterns_noted"][-max_patterns:]
+        # Keep only most recent patterns, trimmed in place
+        del state["patterns_noted"][:-max_patterns]
 
-    save_agent_state(style, state)
-
-
-def update_agent_stats(
-    style: str,
-    outcome: str,
-    points: int,
-    call_summary: dict
-):
-    """Update agent statistics after a call."""
-    state = load_agent_state(style)
 
+def _apply_call_stats(state: dict, outcome: str, points: int, call_summary: dict):
+    """Fold one call's outcome into an agent state in memory."""
     state["total_calls"] += 1
     state["total_points"] += points
 
@@ -218,84 +289,219 @@ def update_agent_stats(
         state["frauds_caught"] += 1
     elif outcome == "fraud_missed":
         state["frauds_missed"] += 1
-    elif outcome in ("missed_opp", "bounce"):
+    elif outcome in _MISSED_OUTCOMES:
         state["missed_opps"] += 1
 
-    # Update last 5 calls
+    # Update last 5 calls, trimmed in place
     state["last_5_calls"].append(call_summary)
-    if len(state["last_5_calls"]) > 5:
-        state["last_5_calls"] = state["last_5_calls"][-5:]
+    del state["last_5_calls"][:-5]
 
-    save_agent_state(style, state)
 
+def add_pattern(style: str, pattern: str, max_patterns: int = 10):
+    """Add a learned pattern to an agent's state."""
+    # Read-modify-write under the lock; the slow save happens outside it
+    with _write_lock:
+        state = load_agent_state(style)
+        _apply_pattern(state, pattern, max_patterns)
+        _agent_states_cache[style] = state
+        _dirty_styles.add(style)
+    _save_all_agent_states()
 
-def load_call_history() -> list:
-    """Load all call history."""
-    global _call_history_cache
 
-    # Return cache if populated
-    if _call_history_cache:
-        return _call_history_cache
+def update_agent_stats(
+    style: str,
+    outcome: str,
+    points: int,
+    call_summary: dict
+):
+    """Update agent statistics after a call."""
+    # Read-modify-write under the lock; the slow save happens outside it
+    with _write_lock:
+        state = load_agent_state(style)
+        _apply_call_stats(state, outcome, points, call_summary)
+        _agent_states_cache[style] = state
+        _dirty_styles.add(style)
+    _save_all_agent_states()
+
+
+def record_call_result(
+    style: str,
+    pattern: str,
+    outcome: str,
+    points: int,
+    call_summary: dict,
+    call_record: dict
+):
+    """Fold everything a finished call produces into the in-memory state.
+
+    Same effect as add_pattern + update_agent_stats + log_call on the
+    caches, but nothing is written; call persist_call_results afterwards
+    to save it.
+    """
+    with _write_lock:
+        state = load_agent_state(style)
+        _apply_call_stats(state, outcome, points, call_summary)
+        _apply_pattern(state, pattern)
+        _agent_states_cache[style] = state
+        _dirty_styles.add(style)
+
+        if not _call_history_cache:
+            load_call_history()
+        _stamp_call(call_record)
+        _call_history_cache.append(call_record)
+
+
+def persist_call_results():
+    """Save the agent states and every call recorded since the last save.
+
+    However many calls have been recorded, this costs one write per
+    target. Works from a snapshot taken under the lock, so other calls can
+    be recorded while the slow writes run.
+    """
+    with _persist_lock:
+        with _write_lock:
+            states, styles = _snapshot_agent_states()
+        _write_agent_states(states, styles)
+        _save_call_log()
+
+
+def _save_call_log():
+    """Save the call history to JSONBin and its unwritten calls to the local log.
+
+    Call with _persist_lock held, so the watermark only moves forward in order.
+    """
+    global _call_log_written
+
+    with _write_lock:
+        history = list(_call_history_cache)
+        start = _call_log_written
+
+    _write_call_log(history, start)
+
+    with _write_lock:
+        _call_log_written = len(history)
 
+
+def _read_call_history() -> tuple[list, bool]:
+    """Read the call history from JSONBin, falling back to local files.
+
+    Returns the calls and whether the read is final; it isn't when
+    JSONBin errored, so a later access tries again.
+    """
     # Try JSONBin first
-    if _jsonbin_enabled():
+    fetched = True
+    if _JSONBIN_ENABLED:
         data = _load_from_jsonbin(JSONBIN_CALLS_BIN_ID)
-        if data and isinstance(data.get("calls"), list):
-            _call_history_cache = data["calls"]
-            return _call_history_cache
+        if data is not None and isinstance(data.get("calls"), list):
+            return data["calls"], True
+        fetched = data is not None
 
     # Fall back to local file
     ensure_directories()
     if CALL_LOGS_FILE.exists():
+        calls = []
+        with open(CALL_LOGS_FILE, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    calls.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    continue  # Torn final line from an interrupted write
+        return calls, fetched
+
+    if LEGACY_CALL_LOGS_FILE.exists():
         try:
-            with open(CALL_LOGS_FILE) as f:
-                _call_history_cache = json.load(f)
-                return _call_history_cache
-        except json.JSONDecodeError:
+            with open(LEGACY_CALL_LOGS_FILE, "rb") as f:
+                return orjson.loads(f.read()), fetched
+        except orjson.JSONDecodeError:
             pass
 
-    return []
+    return [], fetched
 
 
-def log_call(call_record: dict):
-    """Log a completed call."""
-    global _call_history_cache
+def load_call_history() -> list:
+    """Load all call history."""
+    global _call_history_cache, _call_history_loaded, _call_log_written
+
+    # Return cache if populated or already loaded
+    if _call_history_cache or _call_history_loaded:
+        return _call_history_cache
+
+    # One thread does the first load; concurrent callers wait and then use its result
+    with _load_lock:
+        if not (_call_history_cache or _call_history_loaded):
+            calls, final = _read_call_history()
+            _call_history_cache = calls
+            _call_log_written = len(calls)
+            _call_history_loaded = final
+
+    return _call_history_cache
+
+
+def get_last_call_id() -> int:
+    """Get the highest numeric call id in the stored history (0 if none)."""
+    return max(
+        (int(c["call_id"]) for c in load_call_history() if str(c.get("call_id", "")).isdigit()),
+        default=0
+    )
 
-    # Ensure we have the latest
-    if not _call_history_cache:
-        load_call_history()
 
-    # Add call ID and timestamp if not present
+def _stamp_call(call_record: dict):
+    """Add call ID and timestamp if not present."""
     if "call_id" not in call_record:
         call_record["call_id"] = str(uuid.uuid4())
     if "timestamp" not in call_record:
         call_record["timestamp"] = datetime.now().isoformat()
 
-    _call_history_cache.append(call_record)
 
+def _write_call_log(history: list, start: int):
+    """Write the call history to JSONBin and its entries from start on to the local log."""
     # Save to JSONBin
-    if _jsonbin_enabled():
-        _save_to_jsonbin(JSONBIN_CALLS_BIN_ID, {"calls": _call_history_cache})
+    if _JSONBIN_ENABLED:
+        _save_to_jsonbin(JSONBIN_CALLS_BIN_ID, {"calls": history})
 
-    # Also save locally
+    # Also save locally - append new lines, or write the whole history the first
+    # time so calls loaded from JSONBin or the legacy file are carried over
+    new_records = history[start:]
     ensure_directories()
-    with open(CALL_LOGS_FILE, "w") as f:
-        json.dump(_call_history_cache, f, indent=2)
+    if CALL_LOGS_FILE.exists():
+        with open(CALL_LOGS_FILE, "ab") as f:
+            f.writelines(orjson.dumps(c) + b"\n" for c in new_records)
+    else:
+        _write_atomic(CALL_LOGS_FILE, b"".join(orjson.dumps(c) + b"\n" for c in history))
+
+    # One summary line per call for Render logs; the full record is in the log file
+    for call_record in new_records:
+        print(
+            f"CALL LOG: {call_record['call_id']} "
+            f"outcome={call_record.get('outcome')} points={call_record.get('points')}"
+        )
+
+
+def log_call(call_record: dict):
+    """Log a completed call."""
+    with _write_lock:
+        # Ensure we have the latest
+        if not _call_history_cache:
+            load_call_history()
 
-    # Print to console for Render logs
-    print(f"\n{'='*60}")
-    print(f"CALL LOG: {call_record['call_id']}")
-    print(f"{'='*60}")
-    print(json.dumps(call_record, indent=2))
-    print(f"{'='*60}\n")
+        _stamp_call(call_record)
+        _call_history_cache.append(call_record)
+
+    with _persist_lock:
+        _save_call_log()
 
 
 def get_leaderboard() -> list:
     """Get agent leaderboard sorted by total points."""
     all_states = _load_all_agent_states()
+    # Copy the entries first; a writer thread may add a style while we loop
+    with _write_lock:
+        entries = list(all_states.items())
     leaderboard = []
 
-    for style, state in all_states.items():
+    for style, state in entries:
         # Skip invalid entries (not dicts)
         if not isinstance(state, dict):
             continue
@@ -322,37 +528,47 @@ def get_overall_stats() -> dict:
     """Get overall statistics across all agents."""
     history = load_call_history()
 
-    if not history:
+    with _stats_lock:
+        totals = _overall_totals
+        if len(history) < totals["calls"]:
+            # History was replaced rather than appended to, so count from scratch
+            totals.update(calls=0, points=0, outcomes={})
+
+        # History is append-only, so only calls logged since the last count are added
+        new_calls = history[totals["calls"]:]
+        outcome_counts = totals["outcomes"]
+        for c in new_calls:
+            totals["points"] += c.get("points", 0)
+            outcome = c.get("outcome")
+            outcome_counts[outcome] = outcome_counts.get(outcome, 0) + 1
+        totals["calls"] += len(new_calls)
+
         return {
-            "total_calls": 0,
-            "total_points": 0,
-            "conversions": 0,
-            "frauds_caught": 0,
-            "frauds_missed": 0,
-            "missed_opps": 0
+            "total_calls": totals["calls"],
+            "total_points": totals["points"],
+            "conversions": outcome_counts.get("conversion", 0),
+            "frauds_caught": outcome_counts.get("fraud_caught", 0),
+            "frauds_missed": outcome_counts.get("fraud_missed", 0),
+            "missed_opps": sum(outcome_counts.get(o, 0) for o in _MISSED_OUTCOMES)
         }
 
-    stats = {
-        "total_calls": len(history),
-        "total_points": sum(c.get("points", 0) for c in history),
-        "conversions": sum(1 for c in history if c.get("outcome") == "conversion"),
-        "frauds_caught": sum(1 for c in history if c.get("outcome") == "fraud_caught"),
-        "frauds_missed": sum(1 for c in history if c.get("outcome") == "fraud_missed"),
-        "missed_opps": sum(1 for c in history if c.get("outcome") in ("missed_opp", "bounce"))
-    }
-
-    return stats
-
 
 def clear_all_data():
     """Clear all stored data. Use with caution!"""
-    global _call_history_cache, _agent_states_cache
+    global _call_history_cache, _agent_states_cache, _call_history_loaded, _agent_states_loaded
+    global _call_log_written
 
     _call_history_cache = []
     _agent_states_cache = {}
+    _call_history_loaded = False
+    _agent_states_loaded = False
+    _call_log_written = 0
+    with _stats_lock:
+        _overall_totals.update(calls=0, points=0, outcomes={})
+    _dirty_styles.clear()
 
     # Clear JSONBin
-    if _jsonbin_enabled():
+    if _JSONBIN_ENABLED:
         _save_to_jsonbin(JSONBIN_CALLS_BIN_ID, {"calls": []})
         _save_to_jsonbin(JSONBIN_AGENTS_BIN_ID, {})
 
@@ -360,5 +576,6 @@ def clear_all_data():
     ensure_directories()
     for state_file in AGENT_STATES_DIR.glob("*.json"):
         state_file.unlink()
-    if CALL_LOGS_FILE.exists():
-        CALL_LOGS_FILE.unlink()
+    for log_file in (CALL_LOGS_FILE, LEGACY_CALL_LOGS_FILE):
+        if log_file.exists():
+            log_file.unlink()